@@ -4,129 +4,275 @@ Fern Fire Command - Run single file or project
 
 import os
 import sys
+import json
+import errno
+import shutil
+import argparse
+import functools
 import subprocess
 from pathlib import Path
-
-# Add utils to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from types import SimpleNamespace
 
 from utils.colors import print_header, print_success, print_error, print_warning, print_info
-from utils.system import ProjectDetector, BuildSystem
-from utils.config import config
+from utils.system import (ProjectDetector, BuildSystem, EMCC_WEB_SETTINGS, find_fern_source,
+                          report_missing_fern_source)
+from utils.config import config, yaml_modules
 
-def parse_simple_yaml(content):
-    """Simple YAML parser for basic key-value and nested structures"""
-    result = {}
-    lines = content.strip().split('\n')
-    
-    stack = [result]
-    indent_levels = [0]
-    
-    for line in lines:
-        # Skip empty lines and comments
-        stripped = line.strip()
-        if not stripped or stripped.startswith('#'):
-            continue
-        
-        # Calculate indentation level
-        indent = len(line) - len(line.lstrip())
-        
-        # Handle indentation changes - pop stack until we find right level
-        while len(indent_levels) > 1 and indent <= indent_levels[-1]:
-            stack.pop()
-            indent_levels.pop()
-        
-        current_dict = stack[-1]
-        
-        # Parse key-value pairs
-        if ':' in stripped:
-            key, value = stripped.split(':', 1)
-            key = key.strip()
-            value = value.strip()
-            
-            if value:
-                # Simple value - convert type
-                if value.lower() == 'true':
-                    current_dict[key] = True
-                elif value.lower() == 'false':
-                    current_dict[key] = False
-                elif value.isdigit():
-                    current_dict[key] = int(value)
-                else:
-                    current_dict[key] = value
-            else:
-                # Nested object
-                current_dict[key] = {}
-                stack.append(current_dict[key])
-                indent_levels.append(indent)
-    
-    return result
+# Number of projects whose parsed fern.yaml is kept in ~/.fern/cache/projects.json
+_PROJECT_CONFIG_CACHE_SIZE = 32
 
 def load_project_config(project_root):
     """Load project configuration from fern.yaml"""
-    config_file = project_root / "fern.yaml"
-    if not config_file.exists():
+    return _load_project_config(os.path.realpath(project_root / "fern.yaml"))
+
+@functools.lru_cache(maxsize=8)
+def _load_project_config(config_file):
+    """Parse a fern.yaml once per process; the run and serve paths both ask for it"""
+    try:
+        st = os.stat(config_file)
+    except OSError:
         return None
     
+    # Parsed configs are kept keyed by mtime and size, so an unchanged fern.yaml
+    # never pays for importing and running the YAML parser
+    stamp = [st.st_mtime_ns, st.st_size]
+    cache_file = config.config_dir / "cache" / "projects.json"
+    try:
+        cache = json.loads(cache_file.read_text())
+        cached = cache.get(config_file)
+        if cached and cached[:2] == stamp:
+            return cached[2]
+    except (OSError, ValueError, AttributeError, TypeError):
+        cache = {}
+    
     try:
-        with open(config_file, 'r') as f:
-            content = f.read()
-        return parse_simple_yaml(content)
+        mods = yaml_modules()
+        # Hand libyaml the raw bytes; it reads and decodes the stream itself
+        with open(config_file, 'rb') as f:
+            project_config = mods.yaml.load(f, Loader=mods.SafeLoader)
     except Exception as e:
         print_warning(f"Failed to load fern.yaml: {e}")
         return None
+    
+    # Only cache configs JSON gives back unchanged; YAML also allows dates, sets and
+    # non-string keys, which would load differently from the cache than from the file
+    cache.pop(config_file, None)
+    try:
+        if json.loads(json.dumps(project_config)) == project_config:
+            cache[config_file] = stamp + [project_config]
+    except (TypeError, ValueError):
+        pass
+    
+    # Forget projects whose fern.yaml is gone and keep only the most recently parsed ones
+    live = [(path, entry) for path, entry in cache.items() if os.path.isfile(path)]
+    cache = dict(live[-_PROJECT_CONFIG_CACHE_SIZE:])
+    
+    tmp_file = cache_file.with_suffix('.json.tmp')
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file.write_text(json.dumps(cache))
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass
+    return project_config
+
+def _web_port(project_config, default=8000):
+    """Port from platforms.web.port in fern.yaml; any level may be empty or not a mapping"""
+    platforms = project_config.get('platforms') if isinstance(project_config, dict) else None
+    web = platforms.get('web') if isinstance(platforms, dict) else None
+    port = web.get('port', default) if isinstance(web, dict) else default
+    return port if isinstance(port, int) and not isinstance(port, bool) else default
+
+@functools.lru_cache(maxsize=1)
+def _http_modules():
+    """Import the web server modules once, only when a web run needs them"""
+    import io
+    import http.server
+    import socketserver
+    import threading
+    import webbrowser
+    import signal
+    return SimpleNamespace(io=io, http=http, socketserver=socketserver, threading=threading,
+                           webbrowser=webbrowser, signal=signal)
+
+@functools.lru_cache(maxsize=1)
+def _web_build_modules():
+    """Import the library build helpers once, only when the Fern web library is checked"""
+    import hashlib
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+    return SimpleNamespace(hashlib=hashlib, ThreadPoolExecutor=ThreadPoolExecutor,
+                           as_completed=as_completed)
+
+def _ensure_dir(path):
+    """Create a directory if needed; an existing one costs a single stat instead of mkdir plus stat"""
+    if not os.path.isdir(path):
+        os.makedirs(path, exist_ok=True)
+
+@functools.lru_cache(maxsize=1)
+def _original_cwd():
+    """Directory fern was invoked from, which the launcher passes as ORIGINAL_CWD"""
+    original_cwd = os.environ.get('ORIGINAL_CWD')
+    return Path(original_cwd if original_cwd is not None else os.getcwd())
+
+@functools.lru_cache(maxsize=1)
+def _emcc_available():
+    """Check once per process whether Emscripten is on PATH"""
+    return shutil.which("emcc") is not None
+
+@functools.lru_cache(maxsize=1)
+def _fast_linker_flags():
+    """Prefer mold or lld over the default bfd linker when one is installed and g++ accepts it"""
+    for linker, binary in (("mold", "mold"), ("lld", "ld.lld")):
+        if not shutil.which(binary):
+            continue
+        # GCC before 12 rejects -fuse-ld=mold, so ask g++ itself to drive the linker once
+        flag = f"-fuse-ld={linker}"
+        try:
+            probe = subprocess.run(["g++", flag, "-Wl,--version"],
+                                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except OSError:
+            return ()
+        if probe.returncode == 0:
+            return (flag,)
+    return ()
+
+@functools.lru_cache(maxsize=1)
+def _gpp_args():
+    """Return the (prefix, suffix) g++ arguments derived from the global config"""
+    prefix = ("g++", *config.get_build_flags(), "-pipe", *_fast_linker_flags(),
+              *(arg for path in config.get_include_paths() for arg in ("-I", path)))
+    suffix = (*(arg for path in config.get_library_paths() for arg in ("-L", path)),
+              *(arg for lib in config.get_libraries() for arg in ("-l", lib)))
+    return prefix, suffix
+
+# Fern repository root, up from cli/commands/fire.py
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Emscripten flags for development web builds
+_EMCC_BASE_FLAGS = ("-std=c++17", "-O2", *EMCC_WEB_SETTINGS)
+
+# Fern library sources compiled into the web library, relative to <fern_source>/src
+_FERN_SOURCE_DIRS = ("core", "graphics", "text", "font")
+_FERN_RECURSIVE_SOURCE_DIRS = ("ui",)
+_FERN_PLATFORM_SOURCES = ("web_renderer.cpp", "platform_factory.cpp")
+
+def _scan_cpp_files(directory, files, scanned_dirs, recursive=False):
+    """Collect .cpp files in a directory with a single scandir pass per directory"""
+    try:
+        with os.scandir(directory) as entries:
+            scanned_dirs.append(directory)
+            for entry in entries:
+                if entry.name.endswith(".cpp") and entry.is_file():
+                    files.append(entry.path)
+                elif recursive and entry.is_dir():
+                    _scan_cpp_files(entry.path, files, scanned_dirs, recursive=True)
+    except FileNotFoundError:
+        pass
+
+def _write_response_file(path, args):
+    """Write arguments to a GNU-style @response file, leaving it untouched when unchanged"""
+    content = "".join('"' + arg.replace("\\", "\\\\").replace('"', '\\"') + '"\n' for arg in args)
+    try:
+        if path.read_text() == content:
+            return
+    except FileNotFoundError:
+        pass
+    path.write_text(content)
+
+def _newest_mtime(directory):
+    """Latest st_mtime_ns of any file under a directory"""
+    newest = 0
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                newest = max(newest, _newest_mtime(entry.path))
+            else:
+                newest = max(newest, entry.stat().st_mtime_ns)
+    return newest
+
+def _read_depfile(path):
+    """Dependencies listed in a Make-style depfile written by the compiler's -MMD -MF"""
+    with open(path) as f:
+        text = f.read().replace("\\\n", " ")
+    _, _, deps = text.partition(": ")
+    # Spaces inside file names are escaped as '\ '
+    return [dep.replace("\0", " ") for dep in deps.replace("\\ ", "\0").split()]
+
+@functools.lru_cache(maxsize=8)
+def _enumerate_fern_sources(fern_source):
+    """Return (source files, scanned directories) for the Fern web library"""
+    src_dir = os.path.join(fern_source, "src")
+    files = []
+    scanned_dirs = [src_dir]
+    for subdir in _FERN_SOURCE_DIRS:
+        _scan_cpp_files(os.path.join(src_dir, subdir), files, scanned_dirs)
+    for subdir in _FERN_RECURSIVE_SOURCE_DIRS:
+        _scan_cpp_files(os.path.join(src_dir, subdir), files, scanned_dirs, recursive=True)
+    
+    # Platform files are optional, check them against one listing each
+    platform_dir = os.path.join(src_dir, "platform")
+    platform_names = set()
+    if os.path.isdir(platform_dir):
+        platform_names = set(os.listdir(platform_dir))
+        scanned_dirs.append(platform_dir)
+    files.extend(os.path.join(platform_dir, name) for name in _FERN_PLATFORM_SOURCES
+                 if name in platform_names)
+    if os.path.isfile(os.path.join(src_dir, "fern.cpp")):
+        files.append(os.path.join(src_dir, "fern.cpp"))
+    return tuple(files), tuple(scanned_dirs)
+
+class _FireArgumentParser(argparse.ArgumentParser):
+    """Argument parser that raises on bad input instead of exiting"""
+    
+    def error(self, message):
+        raise ValueError(message)
+
+# Built once at import time and reused for every invocation
+_PARSER = _FireArgumentParser(prog="fern fire", add_help=False)
+_PARSER.add_argument("-p", "--platform", choices=("linux", "web"), default="linux",
+                     help="Target platform (linux, web)")
+_PARSER.add_argument("-h", "--help", action="store_true",
+                     help="Show this help message")
+_PARSER.add_argument("file", nargs="?", help="Single file to run instead of the current project")
 
 class FireCommand:
     """Run Fern code - single file or project"""
     
+    # Result of the global installation check, evaluated on first use
+    _FERN_INSTALLED = None
+    
+    @classmethod
+    def _fern_installed(cls):
+        """Check once whether the Fern C++ library is installed globally"""
+        if cls._FERN_INSTALLED is None:
+            cls._FERN_INSTALLED = config.is_fern_installed()
+        return cls._FERN_INSTALLED
+    
     def execute(self, args):
-        # Parse arguments for platform and file
-        platform = "linux"  # default platform
-        file_path = None
-        
-        # Parse arguments
-        i = 0
-        while i < len(args):
-            arg = args[i]
-            if arg in ["--platform", "-p"]:
-                if i + 1 < len(args):
-                    platform = args[i + 1]
-                    i += 2
-                else:
-                    print_error("--platform requires a value (linux, web)")
-                    return
-            elif arg in ["--help", "-h"]:
-                self._show_help()
-                return
-            else:
-                # Assume it's a file path
-                file_path = arg
-                i += 1
-        
-        # Validate platform
-        if platform not in ["linux", "web"]:
-            print_error(f"Unsupported platform: {platform}")
-            print_info("Supported platforms: linux, web")
+        try:
+            # Unknown flags and extra files are errors rather than silently ignored
+            ns = _PARSER.parse_args(args)
+        except ValueError as e:
+            print_error(str(e))
+            print_info("Run 'fern fire --help' for usage")
+            return
+        
+        if ns.help:
+            self._show_help()
             return
         
-        if file_path:
+        if ns.file:
             # File specified, run single file
-            self._run_single_file(file_path, platform)
+            self._run_single_file(ns.file, ns.platform)
         else:
             # No file specified, try to run current project
-            self._run_project(platform)
+            self._run_project(ns.platform)
     
     def _show_help(self):
         """Show help for fire command"""
         print_header("Fern Fire Command")
         print()
-        print_info("Usage:")
-        print("  fern fire [options] [file]")
-        print()
-        print_info("Options:")
-        print("  -p, --platform <platform>   Target platform (linux, web)")
-        print("  -h, --help                  Show this help message")
-        print()
+        print(_PARSER.format_help())
         print_info("Examples:")
         print("  fern fire                   # Run current project for Linux")
         print("  fern fire -p web            # Run current project for web")
@@ -188,12 +334,9 @@ class FireCommand:
         """Run a single Fern file"""
         print_header(f"Running {file_path} ({platform})")
         
-        # Use original working directory if available
-        original_cwd = os.environ.get('ORIGINAL_CWD', os.getcwd())
-        
         # Resolve file path relative to original working directory
         if not os.path.isabs(file_path):
-            file_path = Path(original_cwd) / file_path
+            file_path = _original_cwd() / file_path
         else:
             file_path = Path(file_path)
             
@@ -218,9 +361,7 @@ class FireCommand:
             if self._build_single_file_linux(file_path):
                 print_success("Build successful!")
                 # Run the executable from build directory
-                original_cwd = os.environ.get('ORIGINAL_CWD', os.getcwd())
-                build_dir = Path(original_cwd) / "build"
-                executable = build_dir / (file_path.stem + "_temp")
+                executable = _original_cwd() / "build" / (file_path.stem + "_temp")
                 self._run_executable(executable)
             else:
                 print_error("Build failed")
@@ -229,48 +370,16 @@ class FireCommand:
         """Build a Fern project for Linux"""
         try:
             # Check if Fern is installed globally
-            if not config.is_fern_installed():
+            if not self._fern_installed():
                 print_error("Fern C++ library is not installed globally")
                 print_info("Run './install.sh' from the Fern source directory to install")
                 return False
             
             # Create build directory
             build_dir = build_system.project_root / "build"
-            build_dir.mkdir(exist_ok=True)
-            
-            # Build command using global configuration
-            cmd = ["g++"]
+            _ensure_dir(build_dir)
             
-            # Add build flags
-            cmd.extend(config.get_build_flags())
-            
-            # Add include paths
-            for include_path in config.get_include_paths():
-                cmd.extend(["-I", include_path])
-            
-            # Add source file
-            cmd.append(str(main_file))
-            
-            # Add library paths
-            for lib_path in config.get_library_paths():
-                cmd.extend(["-L", lib_path])
-            
-            # Add libraries
-            for lib in config.get_libraries():
-                cmd.extend(["-l", lib])
-            
-            # Add output
-            cmd.extend(["-o", str(build_dir / "main")])
-            
-            print_info("Compiling...")
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            
-            if result.returncode != 0:
-                print_error("Compilation failed:")
-                print(result.stderr)
-                return False
-            
-            return True
+            return self._compile_linux([main_file], build_dir / "main")
             
         except Exception as e:
             print_error(f"Build error: {str(e)}")
@@ -279,65 +388,17 @@ class FireCommand:
     def _build_project_web(self, build_system, main_file):
         """Build a Fern project for web using Emscripten"""
         try:
-            # Check if Emscripten is available
-            result = subprocess.run(["emcc", "--version"], capture_output=True, text=True)
-            if result.returncode != 0:
-                print_error("Emscripten not found. Please install and activate Emscripten.")
-                print_info("See installation tips: fern bloom")
-                return False
-                
             # Create build directory
             build_dir = build_system.project_root / "build"
-            build_dir.mkdir(exist_ok=True)
-            
-            # Find the Fern source directory
-            fern_source = self._find_fern_source()
-            if not fern_source:
-                return False
-
-            # Check if we have a precompiled Fern web library, or build one
-            fern_web_lib = self._ensure_fern_web_library(fern_source)
-            if not fern_web_lib:
-                return False
-            
-            # Build command using Emscripten - now only compiles user code + links to precompiled library
-            cmd = ["emcc"]
-            
-            # Add Emscripten flags
-            cmd.extend(["-std=c++17", "-O2"])
-            cmd.extend(["-s", "WASM=1"])
-            cmd.extend(["-s", "ALLOW_MEMORY_GROWTH=1"])
-            cmd.extend(["-s", "USE_WEBGL2=1"])
-            cmd.extend(["-s", "EXPORTED_FUNCTIONS=['_main']"])
-            cmd.extend(["-s", "EXPORTED_RUNTIME_METHODS=['ccall','cwrap']"])
-            
-            # Add the source include path for web builds
-            cmd.extend(["-I", str(fern_source / "include")])
-
-            # Add the project's own source file
-            cmd.append(str(main_file))
-
-            # Link against the precompiled Fern web library instead of recompiling all sources
-            cmd.append(str(fern_web_lib))
+            _ensure_dir(build_dir)
             
             # Check for custom template
+            shell_file = None
             project_template = build_system.project_root / "web" / "template.html"
             if project_template.exists():
-                # Use custom template
-                cmd.extend(["--shell-file", str(project_template)])
-            
-            # Add output file
-            cmd.extend(["-o", str(build_dir / "main.html")])
+                shell_file = project_template
             
-            print_info("Compiling for web...")
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            
-            if result.returncode != 0:
-                print_error("Web compilation failed:")
-                print(result.stderr)
-                return False
-                
-            return True
+            return self._compile_web(main_file, build_dir / "main.html", shell_file)
         except Exception as e:
             print_error(f"Web build error: {str(e)}")
             return False
@@ -346,52 +407,17 @@ class FireCommand:
         """Build a single Fern file for Linux"""
         try:
             # Check if Fern is installed globally
-            if not config.is_fern_installed():
+            if not self._fern_installed():
                 print_error("Fern C++ library is not installed globally")
                 print_info("Run './install.sh' from the Fern source directory to install")
                 return False
             
             # Create a build directory in the original working directory
-            original_cwd = os.environ.get('ORIGINAL_CWD', os.getcwd())
-            build_dir = Path(original_cwd) / "build"
-            build_dir.mkdir(exist_ok=True)
+            build_dir = _original_cwd() / "build"
+            _ensure_dir(build_dir)
             
             # Output executable name in build directory
-            output_file = build_dir / (file_path.stem + "_temp")
-            
-            # Build command using global configuration
-            cmd = ["g++"]
-            
-            # Add build flags
-            cmd.extend(config.get_build_flags())
-            
-            # Add include paths
-            for include_path in config.get_include_paths():
-                cmd.extend(["-I", include_path])
-            
-            # Add source file
-            cmd.append(str(file_path))
-            
-            # Add library paths
-            for lib_path in config.get_library_paths():
-                cmd.extend(["-L", lib_path])
-            
-            # Add libraries
-            for lib in config.get_libraries():
-                cmd.extend(["-l", lib])
-            
-            # Add output
-            cmd.extend(["-o", str(output_file)])
-            
-            print_info("Compiling...")
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            
-            if result.returncode != 0:
-                print_error("Compilation failed:")
-                print(result.stderr)
-                return False
-            
-            return True
+            return self._compile_linux([file_path], build_dir / (file_path.stem + "_temp"))
             
         except Exception as e:
             print_error(f"Build error: {str(e)}")
@@ -400,84 +426,89 @@ class FireCommand:
     def _build_single_file_web(self, file_path):
         """Build a single Fern file for web using Emscripten"""
         try:
-            # Check if Emscripten is available
-            result = subprocess.run(["emcc", "--version"], capture_output=True, text=True)
-            if result.returncode != 0:
-                print_error("Emscripten not found. Please install and activate Emscripten.")
-                print_info("See installation tips: fern bloom")
-                return False
-            
             # Check if Fern is installed globally
-            if not config.is_fern_installed():
+            if not self._fern_installed():
                 print_error("Fern C++ library is not installed globally")
                 print_info("Run './install.sh' from the Fern source directory to install")
                 return False
             
             # Create a build directory in the original working directory
-            original_cwd = os.environ.get('ORIGINAL_CWD', os.getcwd())
-            build_dir = Path(original_cwd) / "build"
-            build_dir.mkdir(exist_ok=True)
-            
-            # Output HTML file name
-            output_file = build_dir / (file_path.stem + "_temp.html")
-            
-            # Find the Fern source directory
-            fern_source = self._find_fern_source()
-            if not fern_source:
-                return False
-
-            # Check if we have a precompiled Fern web library, or build one
-            fern_web_lib = self._ensure_fern_web_library(fern_source)
-            if not fern_web_lib:
-                return False
-            
-            # Build command using Emscripten - now only compiles user code + links to precompiled library
-            cmd = ["emcc"]
-            
-            # Add Emscripten flags
-            cmd.extend(["-std=c++17", "-O2"])
-            cmd.extend(["-s", "WASM=1"])
-            cmd.extend(["-s", "ALLOW_MEMORY_GROWTH=1"])
-            cmd.extend(["-s", "USE_WEBGL2=1"])
-            cmd.extend(["-s", "EXPORTED_FUNCTIONS=['_main']"])
-            cmd.extend(["-s", "EXPORTED_RUNTIME_METHODS=['ccall','cwrap']"])
-            
-            # Add the source include path for web builds
-            cmd.extend(["-I", str(fern_source / "include")])
-            
-            # Add source file
-            cmd.append(str(file_path))
-            
-            # Link against the precompiled Fern web library instead of recompiling all sources
-            cmd.append(str(fern_web_lib))
+            original_cwd = _original_cwd()
+            build_dir = original_cwd / "build"
+            _ensure_dir(build_dir)
             
             # Check for custom template in current directory or use default
-            local_template = Path(original_cwd) / "template.html"
-            global_template = Path(__file__).parent.parent.parent / "template.html"
+            shell_file = next((template for template in (
+                os.path.join(original_cwd, "template.html"),
+                os.path.join(_REPO_ROOT, "template.html"),
+            ) if os.path.isfile(template)), None)
             
-            if local_template.exists():
-                # Use local template
-                cmd.extend(["--shell-file", str(local_template)])
-            elif global_template.exists():
-                # Use global template
-                cmd.extend(["--shell-file", str(global_template)])
-            
-            # Add output
-            cmd.extend(["-o", str(output_file)])
-            
-            print_info("Compiling for web...")
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            
-            if result.returncode != 0:
-                print_error("Web compilation failed:")
-                print(result.stderr)
-                return False
-            
-            return True
+            return self._compile_web(file_path, build_dir / (file_path.stem + "_temp.html"), shell_file)
             
         except Exception as e:
             print_error(f"Web build error: {str(e)}")
             return False
+    
+    def _compile_linux(self, sources, output):
+        """Compile and link sources into a native executable with g++"""
+        # Build command using global configuration (flags, includes and libraries are cached)
+        prefix, suffix = _gpp_args()
+        cmd = [*prefix, *map(os.fspath, sources), *suffix, "-o", os.fspath(output)]
+        
+        print_info("Compiling...")
+        if self._run_compiler(cmd) != 0:
+            print_error("Compilation failed (see errors above)")
+            return False
+        
+        return True
+    
+    def _compile_web(self, main_source, output_html, shell_file=None):
+        """Compile a source file against the precompiled Fern web library with emcc"""
+        # Check if Emscripten is available
+        if not _emcc_available():
+            print_error("Emscripten not found. Please install and activate Emscripten.")
+            print_info("See installation tips: fern bloom")
+            return False
+        
+        # Find the Fern source directory
+        fern_source = self._find_fern_source()
+        if not fern_source:
+            return False
+
+        # Check if we have a precompiled Fern web library, or build one
+        fern_web_lib = self._ensure_fern_web_library(fern_source)
+        if not fern_web_lib:
+            return False
+        
+        # Build command using Emscripten - only compiles user code + links to precompiled library
+        cmd = [
+            "emcc", *_EMCC_BASE_FLAGS,
+            # Add the source include path for web builds
+            "-I", os.fspath(fern_source / "include"),
+            os.fspath(main_source),
+            # Link against the precompiled Fern web library instead of recompiling all sources
+            os.fspath(fern_web_lib),
+        ]
+        
+        # Use a custom HTML shell if one was found
+        if shell_file:
+            cmd.extend(["--shell-file", os.fspath(shell_file)])
+        
+        # Add output
+        cmd.extend(["-o", os.fspath(output_html)])
+        
+        print_info("Compiling for web...")
+        if self._run_compiler(cmd) != 0:
+            print_error("Web compilation failed (see errors above)")
+            return False
+        
+        return True
+
+    def _run_compiler(self, cmd):
+        """Run a compiler with its diagnostics going straight to the terminal, returning the exit code"""
+        # Errors show up as they are produced instead of being buffered until exit
+        sys.stdout.flush()
+        return subprocess.run(cmd, stdout=subprocess.DEVNULL).returncode
 
     def _run_web_project(self, project_root):
         """Run web project by starting a local server"""
@@ -490,79 +521,11 @@ class FireCommand:
                 return
 
             # Load project configuration to get port
-            project_config = load_project_config(project_root)
-            port = 8000  # default port
-            if project_config and 'platforms' in project_config and 'web' in project_config['platforms']:
-                port = project_config['platforms']['web'].get('port', 8000)
-
-            # Find an available port if the default is in use
-            port = self._find_available_port(port)
+            port = _web_port(load_project_config(project_root))
 
             print_info("Starting local web server...")
-            print_success("Fern Fire started (web)!")
-            print()
-            print_info(f"Open your browser to: http://localhost:{port}/main.html")
-            print_info("Press Ctrl+C to stop the server")
-            print()
 
-            # Start HTTP server with proper cleanup
-            import http.server
-            import socketserver
-            import threading
-            import webbrowser
-            import time
-            import signal
-            
-            os.chdir(build_dir)
-            
-            # Create server with socket reuse
-            class ReusableTCPServer(socketserver.TCPServer):
-                allow_reuse_address = True
-                
-                def server_close(self):
-                    super().server_close()
-                    # Give the socket time to close properly
-                    time.sleep(0.1)
-            
-            httpd = None
-            
-            def start_server():
-                nonlocal httpd
-                try:
-                    httpd = ReusableTCPServer(("", port), http.server.SimpleHTTPRequestHandler)
-                    httpd.serve_forever()
-                except OSError as e:
-                    if e.errno == 98:  # Address already in use
-                        print_error(f"Port {port} is already in use")
-                        return
-                    raise
-            
-            def signal_handler(signum, frame):
-                if httpd:
-                    print_info("\\nGracefully shutting down web server...")
-                    httpd.shutdown()
-                    httpd.server_close()
-
-            # Set up signal handlers for graceful shutdown
-            signal.signal(signal.SIGINT, signal_handler)
-            signal.signal(signal.SIGTERM, signal_handler)
-
-            server_thread = threading.Thread(target=start_server, daemon=False)
-            server_thread.start()
-
-            # Wait a moment then open browser
-            time.sleep(1)
-            webbrowser.open(f"http://localhost:{port}/main.html")
-            
-            # Keep running until interrupted
-            try:
-                while server_thread.is_alive():
-                    time.sleep(0.1)
-            except KeyboardInterrupt:
-                if httpd:
-                    print_info("\\nStopping web server...")
-                    httpd.shutdown()
-                    httpd.server_close()
+            self._serve_build_dir(build_dir, port, html_file.name)
                     
         except Exception as e:
             print_error(f"Error running web project: {str(e)}")
@@ -571,8 +534,7 @@ class FireCommand:
         """Run web file by starting a local server"""
         try:
             # Get original working directory for build location
-            original_cwd = os.environ.get('ORIGINAL_CWD', os.getcwd())
-            build_dir = Path(original_cwd) / "build"
+            build_dir = _original_cwd() / "build"
             html_file = build_dir / (file_path.stem + "_temp.html")
 
             if not html_file.exists():
@@ -581,84 +543,90 @@ class FireCommand:
 
             # Try to load project config for port, fallback to default
             project_root = ProjectDetector.find_project_root()
-            port = 8000  # default port
-            if project_root:
-                project_config = load_project_config(project_root)
-                if project_config and 'platforms' in project_config and 'web' in project_config['platforms']:
-                    port = project_config['platforms']['web'].get('port', 8000)
-
-            # Find an available port if the default is in use
-            port = self._find_available_port(port)
+            port = _web_port(load_project_config(project_root) if project_root else None)
 
             print_info("Starting local web server...")
-            print_success("🔥 Fern Fire started (web)!")
-            print()
-            print_info(f"Open your browser to: http://localhost:{port}/{html_file.name}")
-            print_info("Press Ctrl+C to stop the server")
-            print()
-            
-            # Start HTTP server with proper cleanup
-            import http.server
-            import socketserver
-            import threading
-            import webbrowser
-            import time
-            import signal
-            
-            os.chdir(build_dir)
-            
-            # Create server with socket reuse
-            class ReusableTCPServer(socketserver.TCPServer):
-                allow_reuse_address = True
-                
-                def server_close(self):
-                    super().server_close()
-                    # Give the socket time to close properly
-                    time.sleep(0.1)
-            
-            httpd = None
             
-            def start_server():
-                nonlocal httpd
-                try:
-                    httpd = ReusableTCPServer(("", port), http.server.SimpleHTTPRequestHandler)
-                    httpd.serve_forever()
-                except OSError as e:
-                    if e.errno == 98:  # Address already in use
-                        print_error(f"Port {port} is already in use")
-                        return
-                    raise
-            
-            def signal_handler(signum, frame):
-                if httpd:
-                    print_info("\\nGracefully shutting down web server...")
-                    httpd.shutdown()
-                    httpd.server_close()
-
-            # Set up signal handlers for graceful shutdown
-            signal.signal(signal.SIGINT, signal_handler)
-            signal.signal(signal.SIGTERM, signal_handler)
-
-            server_thread = threading.Thread(target=start_server, daemon=False)
-            server_thread.start()
-
-            # Wait a moment then open browser
-            time.sleep(1)
-            webbrowser.open(f"http://localhost:{port}/{html_file.name}")
-            
-            # Keep running until interrupted
-            try:
-                while server_thread.is_alive():
-                    time.sleep(0.1)
-            except KeyboardInterrupt:
-                if httpd:
-                    print_info("\\nStopping web server...")
-                    httpd.shutdown()
-                    httpd.server_close()
+            self._serve_build_dir(build_dir, port, html_file.name)
                 
         except Exception as e:
             print_error(f"Error running web file: {str(e)}")
     
+    def _serve_build_dir(self, build_dir, port, page):
+        """Serve a web build directory until interrupted, opening page in the browser"""
+        mods = _http_modules()
+        http, socketserver, threading = mods.http, mods.socketserver, mods.threading
+        webbrowser, signal, io = mods.webbrowser, mods.signal, mods.io
+        
+        # Zero-copy file bodies: large .wasm files go straight from the page cache to the socket
+        class SendfileRequestHandler(http.server.SimpleHTTPRequestHandler):
+            def copyfile(self, source, outputfile):
+                # Directory listings arrive as an in-memory BytesIO with no descriptor
+                try:
+                    in_fd = source.fileno()
+                except (AttributeError, io.UnsupportedOperation):
+                    in_fd = None
+                if in_fd is None or not hasattr(os, "sendfile"):
+                    return super().copyfile(source, outputfile)
+                
+                start = offset = source.tell()
+                size = os.fstat(in_fd).st_size
+                while offset < size:
+                    try:
+                        sent = os.sendfile(self.connection.fileno(), in_fd, offset, size - offset)
+                    except OSError:
+                        # Nothing on the wire yet, so the plain copy can still serve the body
+                        if offset == start:
+                            return super().copyfile(source, outputfile)
+                        raise
+                    if sent == 0:
+                        break
+                    offset += sent
+        
+        # Threaded server so the browser can fetch html, js and wasm in parallel
+        class WebServer(http.server.ThreadingHTTPServer):
+            def server_bind(self):
+                # Skip HTTPServer's reverse DNS lookup of the host name
+                socketserver.TCPServer.server_bind(self)
+                self.server_name, self.server_port = "localhost", self.server_address[1]
+        
+        # Serve build_dir without changing the process working directory
+        handler = functools.partial(SendfileRequestHandler, directory=os.fspath(build_dir))
+        
+        try:
+            httpd = WebServer(("", port), handler)
+        except OSError as e:
+            if e.errno != errno.EADDRINUSE:
+                raise
+            # Let the kernel pick a free port instead of probing candidates one by one
+            httpd = WebServer(("", 0), handler)
+            print_warning(f"Port {port} is already in use, using port {httpd.server_address[1]}")
+        
+        port = httpd.server_address[1]
+        url = f"http://localhost:{port}/{page}"
+        
+        print_success("🔥 Fern Fire started (web)!")
+        print()
+        print_info(f"Open your browser to: {url}")
+        print_info("Press Ctrl+C to stop the server")
+        print()
+        
+        # Treat SIGTERM like Ctrl+C so both stop the server the same way
+        signal.signal(signal.SIGTERM, signal.default_int_handler)
+        
+        # The socket is already listening, so the browser can connect right away; open
+        # it off the main thread in case the browser command blocks until it exits
+        threading.Thread(target=webbrowser.open, args=(url,), daemon=True).start()
+        
+        try:
+            # Nothing calls shutdown() from another thread, so block in select()
+            # until a request or signal arrives instead of waking every 0.5s
+            httpd.serve_forever(poll_interval=None)
+        except KeyboardInterrupt:
+            print_info("\nStopping web server...")
+        finally:
+            httpd.server_close()
+    
     def _run_executable(self, executable_path):
         """Run the compiled executable"""
         try:
@@ -670,146 +638,100 @@ class FireCommand:
             print_success("🔥 Fern Fire started!")
             print()
             
-            # Run the executable
-            subprocess.run([str(executable_path)], check=True)
+            # Replace the CLI process with the executable; fire is always the last
+            # thing the CLI does, so there is nothing to return to
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os.execv(str(executable_path), [str(executable_path)])
             
-        except subprocess.CalledProcessError as e:
-            print_error(f"Runtime error: {e}")
-        except KeyboardInterrupt:
-            print_info("\\nStopped by user")
         except Exception as e:
             print_error(f"Error running executable: {str(e)}")
     
     def _find_fern_source(self):
         """Find the Fern source directory for web builds"""
-        # Get the directory where the CLI is located (should be the Fern repo)
-        cli_dir = Path(__file__).parent.parent.parent  # Go up from cli/commands/fire.py to repo root
-        
-        potential_sources = [
-            Path.home() / ".fern",  # Global source installation (primary location)
-            cli_dir,  # The Fern repository root where the CLI is located
-            Path("/home/rishi/git/test/fern"),  # Hardcoded development path
-            Path(os.getcwd()),  # Current working directory (if run from Fern repo)
-            Path(os.environ.get('ORIGINAL_CWD', os.getcwd())).parent,  # Parent of original working dir
-            Path("/usr/local/src/fern"),  # System-wide source location
-            Path.home() / ".fern" / "src"  # Alternative user location
-        ]
+        fern_source = find_fern_source()
+        if fern_source is None:
+            report_missing_fern_source()
+            return None
         
-        for src_path in potential_sources:
-            # Check if this looks like the Fern source directory
-            cpp_src = src_path / "src" / "cpp"
-            if (cpp_src.exists() and 
-                (cpp_src / "include" / "fern").exists() and
-                (cpp_src / "src").exists()):
-                print_info(f"Found Fern source for web build at: {cpp_src}")
-                return cpp_src
-
-        print_error("Fern source files not found for web compilation.")
-        print_info("Searched the following locations:")
-        for src_path in potential_sources:
-            cpp_src = src_path / "src" / "cpp"
-            status = "✓" if cpp_src.exists() else "✗"
-            print_info(f"  {status} {cpp_src}")
-        print_info("Web builds require access to Fern source files.")
-        print_info("Run './install.sh' from the Fern repository to install source files globally.")
-        return None
+        print_info(f"Found Fern source for web build at: {fern_source}")
+        return fern_source
 
     def _ensure_fern_web_library(self, fern_source):
         """Ensure a precompiled Fern web library exists, building it if necessary"""
         # Create a cache directory for precompiled web libraries
         cache_dir = Path.home() / ".fern" / "cache" / "web"
-        cache_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Check if we need to rebuild by comparing source timestamps
-        lib_file = cache_dir / "libfern_web.a"
-        needs_rebuild = True
+        _ensure_dir(cache_dir)
         
-        if lib_file.exists():
-            lib_mtime = lib_file.stat().st_mtime
-            
-            # Check if any source file is newer than the library
-            source_newer = False
-            patterns = ["core/*.cpp", "graphics/*.cpp", "text/*.cpp", "font/*.cpp", "ui/**/*.cpp"]
-            
-            for pattern in patterns:
-                for src_file in fern_source.glob(f"src/{pattern}"):
-                    if src_file.stat().st_mtime > lib_mtime:
-                        source_newer = True
-                        break
-                if source_newer:
-                    break
-            
-            # Also check platform files
-            platform_files = [
-                fern_source / "src/platform/web_renderer.cpp",
-                fern_source / "src/platform/platform_factory.cpp", 
-                fern_source / "src/fern.cpp"
-            ]
-            
-            for platform_file in platform_files:
-                if platform_file.exists() and platform_file.stat().st_mtime > lib_mtime:
-                    source_newer = True
-                    break
-            
-            needs_rebuild = source_newer
+        mods = _web_build_modules()
+        plan = self._web_library_plan(fern_source, cache_dir)
+        lib_file, lib_key_file, lib_key = plan.lib_file, plan.lib_key_file, plan.lib_key
+        source_files, obj_dir, object_files = plan.source_files, plan.obj_dir, plan.object_files
+        object_flags, flags_hash, dep_mtimes = plan.object_flags, plan.flags_hash, plan.dep_mtimes
         
-        if needs_rebuild:
+        if plan.needs_rebuild:
             print_info("Building Fern web library (this may take a moment)...")
             
-            # Collect all source files
-            source_files = []
-            patterns = ["core/*.cpp", "graphics/*.cpp", "text/*.cpp", "font/*.cpp", "ui/**/*.cpp"]
-            for pattern in patterns:
-                for src_file in fern_source.glob(f"src/{pattern}"):
-                    source_files.append(src_file)
-            
-            # Add platform files
-            platform_files = [
-                fern_source / "src/platform/web_renderer.cpp",
-                fern_source / "src/platform/platform_factory.cpp",
-                fern_source / "src/fern.cpp"
-            ]
-            
-            for platform_file in platform_files:
-                if platform_file.exists():
-                    source_files.append(platform_file)
+            # Invalidate every cached object when the compile flags change
+            flags_file = obj_dir / ".flags"
+            if not flags_file.exists() or flags_file.read_text() != flags_hash:
+                shutil.rmtree(obj_dir, ignore_errors=True)
+            else:
+                self._prune_stale_objects(obj_dir, object_files)
             
-            # Compile each source file to an object file
-            object_files = []
+            # Only recompile translation units whose source or included headers changed
+            jobs = [(src_file, obj_file) for src_file, obj_file in zip(source_files, object_files)
+                    if self._needs_rebuild(src_file, obj_file, dep_mtimes)]
+            obj_dir.mkdir(parents=True, exist_ok=True)
             
             try:
-                for i, src_file in enumerate(source_files):
-                    obj_file = cache_dir / f"obj_{i}.o"
-                    object_files.append(obj_file)
-                    
-                    # Compile individual source file
-                    cmd = [
-                        "emcc", "-std=c++17", "-O2", "-c",
-                        "-I", str(fern_source / "include"),
-                        str(src_file),
-                        "-o", str(obj_file)
-                    ]
-                    
-                    result = subprocess.run(cmd, capture_output=True, text=True)
-                    if result.returncode != 0:
+                # Parse the umbrella header once instead of in every translation unit
+                pch_file = self._ensure_fern_pch(fern_source, object_flags, obj_dir) if jobs else None
+                compile_flags = (*object_flags, "-include-pch", os.fspath(pch_file)) if pch_file else object_flags
+                
+                # Workers only wait on emcc child processes, so threads are enough to use every core
+                with mods.ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as executor:
+                    futures = {executor.submit(self._compile_web_object, compile_flags, *job): job[0]
+                               for job in jobs}
+                    for future in mods.as_completed(futures):
+                        if future.result().returncode != 0:
+                            # Skip queued units after the first error; running ones still finish
+                            for pending in futures:
+                                pending.cancel()
+                            break
+                
+                failures = [(src_file, future.result().stderr) for future, src_file in futures.items()
+                            if not future.cancelled() and future.result().returncode != 0]
+                if failures:
+                    for src_file, stderr in failures:
                         print_error(f"Failed to compile {src_file.name}:")
-                        print(result.stderr)
-                        return None
+                        print(stderr)
+                    return None
                 
-                # Create static library from object files
-                cmd = ["emar", "rcs", str(lib_file)] + [str(obj) for obj in object_files]
-                result = subprocess.run(cmd, capture_output=True, text=True)
+                # One summary line rather than per-unit output from the workers
+                print_info(f"Compiled {len(jobs)} of {len(source_files)} Fern sources "
+                           f"({len(source_files) - len(jobs)} up to date)")
+                
+                # Create static library from object files; start from an empty archive
+                # since 'r' would keep members of sources that no longer exist
+                try:
+                    lib_file.unlink()
+                except FileNotFoundError:
+                    pass
+                # Object paths go through a response file so argv stays small however large the library grows
+                objects_rsp = obj_dir / "objects.rsp"
+                _write_response_file(objects_rsp, map(os.fspath, object_files))
+                cmd = ["emar", "rcs", os.fspath(lib_file), f"@{objects_rsp}"]
+                result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
                 
                 if result.returncode != 0:
                     print_error("Failed to create Fern web library:")
                     print(result.stderr)
                     return None
                 
-                # Clean up object files
-                for obj_file in object_files:
-                    if obj_file.exists():
-                        obj_file.unlink()
-                        
+                flags_file.write_text(flags_hash)
+                lib_key_file.write_text(lib_key)
+                
                 print_success("Fern web library built successfully!")
                 
             except Exception as e:
@@ -820,41 +742,149 @@ class FireCommand:
         
         return lib_file
 
-    def _find_available_port(self, start_port, max_attempts=10):
-        """Find an available port starting from start_port"""
-        import socket
+    def _web_library_plan(self, fern_source, cache_dir, persist=True):
+        """Work out the web library's inputs and whether the cached archive is still current"""
+        lib_file = cache_dir / "libfern_web.a"
+        needs_rebuild = True
+        
+        # Collect all source files; object files are kept between builds, with names
+        # flattened from the source path because archive members are keyed by basename
+        source_files = [Path(src) for src in self._read_or_build_manifest(fern_source, cache_dir, persist)]
+        obj_dir = cache_dir / "obj"
+        src_root = fern_source / "src"
+        object_files = [obj_dir / (str(src_file.relative_to(src_root)).replace(os.sep, "__") + ".o")
+                        for src_file in source_files]
+        
+        # Dependency mtimes shared by every object check, since most headers are included everywhere
+        dep_mtimes = {}
+        
+        hashlib = _web_build_modules().hashlib
+        
+        # The library is keyed on its flags and source list, so removed sources trigger a rebuild too
+        object_flags = self._web_object_flags(fern_source)
+        flags_hash = hashlib.sha256("\0".join(object_flags).encode()).hexdigest()
+        lib_key_file = cache_dir / "libfern_web.key"
+        lib_key = hashlib.sha256("\0".join((flags_hash, *map(os.fspath, source_files))).encode()).hexdigest()
+        
+        try:
+            lib_mtime = os.stat(lib_file).st_mtime_ns
+            if lib_key_file.read_text() == lib_key:
+                # Rebuild if any object is out of date with its source or headers, or
+                # was recompiled after the archive was last written
+                needs_rebuild = any(self._needs_rebuild(src_file, obj_file, dep_mtimes) or
+                                    os.stat(obj_file).st_mtime_ns > lib_mtime
+                                    for src_file, obj_file in zip(source_files, object_files))
+        except OSError:
+            pass
+        
+        return SimpleNamespace(lib_file=lib_file, lib_key_file=lib_key_file, lib_key=lib_key,
+                               source_files=source_files, obj_dir=obj_dir, object_files=object_files,
+                               object_flags=object_flags, flags_hash=flags_hash,
+                               dep_mtimes=dep_mtimes, needs_rebuild=needs_rebuild)
+
+    def _read_or_build_manifest(self, fern_source, cache_dir, persist=True):
+        """Load the Fern source list from the manifest, rescanning only when it is stale"""
+        manifest_file = cache_dir / "sources.json"
+        
+        # Adding or removing a file bumps its directory's mtime, so one stat per
+        # scanned directory is enough to trust the cached list
+        try:
+            manifest = json.loads(manifest_file.read_text())
+            if (manifest["fern_source"] == os.fspath(fern_source) and
+                    all(os.stat(d).st_mtime_ns == mtime for d, mtime in manifest["dirs"].items())):
+                return manifest["sources"]
+        except (OSError, ValueError, KeyError):
+            pass
         
-        for i in range(max_attempts):
-            port = start_port + i
+        sources, scanned_dirs = _enumerate_fern_sources(os.fspath(fern_source))
+        manifest = {
+            "fern_source": os.fspath(fern_source),
+            "dirs": {d: os.stat(d).st_mtime_ns for d in scanned_dirs},
+            "sources": list(sources),
+        }
+        if persist:
             try:
-                # Try to bind to the port to check if it's available
-                with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                    s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-                    s.bind(('', port))
-                    return port
+                manifest_file.write_text(json.dumps(manifest))
             except OSError:
-                # Port is in use, try the next one
-                continue
+                pass
+        return manifest["sources"]
+
+    def _prune_stale_objects(self, obj_dir, object_files):
+        """Delete cached object files whose source no longer exists"""
+        keep = {obj_file.name for obj_file in object_files}
+        try:
+            with os.scandir(obj_dir) as entries:
+                for entry in entries:
+                    # Depfiles sit next to their object as <name>.o.d
+                    name = entry.name[:-2] if entry.name.endswith(".o.d") else entry.name
+                    if name.endswith(".o") and name not in keep:
+                        os.unlink(entry.path)
+        except FileNotFoundError:
+            pass
+
+    def _web_object_flags(self, fern_source):
+        """Compile flags used for Fern web library object files"""
+        return ("-std=c++17", "-O2", "-c", "-I", os.fspath(fern_source / "include"))
+
+    def _needs_rebuild(self, src_file, obj_file, dep_mtimes):
+        """Check if an object file is missing or older than its source or any header it included"""
+        # The compiler's depfile lists the source and every non-system header; an object
+        # without one predates dependency tracking and is rebuilt once
+        try:
+            obj_mtime = os.stat(obj_file).st_mtime_ns
+            deps = _read_depfile(f"{obj_file}.d")
+            for dep in deps:
+                if dep not in dep_mtimes:
+                    dep_mtimes[dep] = os.stat(dep).st_mtime_ns
+                if dep_mtimes[dep] > obj_mtime:
+                    return True
+        except OSError:
+            # Missing object, depfile, or a header that has since been deleted
+            return True
+        return not deps
+
+    def _ensure_fern_pch(self, fern_source, object_flags, obj_dir):
+        """Precompile fern/fern.hpp for the library build, returning its path or None to compile without it"""
+        include_dir = fern_source / "include"
+        header = include_dir / "fern" / "fern.hpp"
+        pch_file = obj_dir / "fern.hpp.pch"
+        
+        # Clang rejects a PCH once any header it pulled in is modified, so compare against all of them
+        try:
+            if os.stat(pch_file).st_mtime_ns >= _newest_mtime(include_dir):
+                return pch_file
+        except FileNotFoundError:
+            pass
+        
+        if not header.is_file():
+            return None
         
-        # If we can't find any available port, use the original and let it fail gracefully
-        print_warning(f"Could not find available port starting from {start_port}, using {start_port}")
-        return start_port
+        header_flags = [flag for flag in object_flags if flag != "-c"]
+        cmd = ["emcc", *header_flags, "-x", "c++-header", os.fspath(header), "-o", os.fspath(pch_file)]
+        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+        if result.returncode != 0:
+            # Not fatal: the library still builds, just without the shared header parse
+            print_warning("Could not precompile fern/fern.hpp, compiling without it")
+            try:
+                pch_file.unlink()
+            except FileNotFoundError:
+                pass
+            return None
+        return pch_file
+
+    def _compile_web_object(self, object_flags, src_file, obj_file):
+        """Compile a single Fern source file to a web object file"""
+        cmd = ["emcc", *object_flags, "-MMD", "-MF", f"{obj_file}.d",
+               os.fspath(src_file), "-o", os.fspath(obj_file)]
+        return subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
 
     def _cleanup_temp_files(self, file_path):
         """Clean up temporary files"""
-        temp_file = file_path.parent / (file_path.stem + "_temp")
-        if temp_file.exists():
-            temp_file.unlink()
-            print_info("Cleaned up temporary files")
-        
-        # Also clean up web temp files
-        web_temp_files = [
-            file_path.parent / (file_path.stem + "_temp.html"),
-            file_path.parent / (file_path.stem + "_temp.js"),
-            file_path.parent / (file_path.stem + "_temp.wasm")
-        ]
+        # One directory scan covers the native executable and the web outputs
+        temp_stem = file_path.stem + "_temp"
+        temp_names = {temp_stem + suffix for suffix in ("", ".html", ".js", ".wasm")}
         
-        for temp_file in web_temp_files:
-            if temp_file.exists():
+        for temp_file in file_path.parent.glob(f"{temp_stem}*"):
+            if temp_file.name in temp_names:
                 temp_file.unlink()
-                print_info(f"Cleaned up web temp file: {temp_file.name}")
+                print_info(f"Cleaned up temporary file: {temp_file.name}")
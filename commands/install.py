@@ -3,14 +3,10 @@ Fern Install Command - Install packages and dependencies
 """
 
 import os
-import sys
 import subprocess
 import requests
 from pathlib import Path
 
-# Add utils to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from utils.colors import print_header, print_success, print_error, print_warning, print_info
 
 class InstallCommand:
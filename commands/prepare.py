@@ -2,19 +2,19 @@
 Fern Prepare Command - Build for different platforms
 """
 
-import os
 import sys
 import subprocess
 import shutil
 from pathlib import Path
 
-# Add utils to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from utils.colors import print_header, print_success, print_error, print_warning, print_info
-from utils.system import ProjectDetector, BuildSystem
+from utils.system import (ProjectDetector, BuildSystem, EMCC_WEB_SETTINGS, find_fern_source,
+                          report_missing_fern_source)
 from utils.config import config
 
+# Emscripten flags for production web builds (O3 for production)
+_EMCC_RELEASE_FLAGS = ("-std=c++17", "-O3", *EMCC_WEB_SETTINGS)
+
 class PrepareCommand:
     """Build Fern project for different platforms"""
     
@@ -84,15 +84,7 @@ class PrepareCommand:
             print_info("Compiling with Emscripten...")
             
             # Build command using Emscripten - uses precompiled library
-            cmd = ["emcc"]
-            
-            # Add Emscripten flags for production build
-            cmd.extend(["-std=c++17", "-O3"])  # O3 for production
-            cmd.extend(["-s", "WASM=1"])
-            cmd.extend(["-s", "ALLOW_MEMORY_GROWTH=1"])
-            cmd.extend(["-s", "USE_WEBGL2=1"])
-            cmd.extend(["-s", "EXPORTED_FUNCTIONS=['_main']"])
-            cmd.extend(["-s", "EXPORTED_RUNTIME_METHODS=['ccall','cwrap']"])
+            cmd = ["emcc", *_EMCC_RELEASE_FLAGS]
             
             # Add the source include path
             cmd.extend(["-I", str(fern_source / "include")])
@@ -115,11 +107,10 @@ class PrepareCommand:
             # Add output file
             cmd.extend(["-o", str(web_build_dir / "index.html")])
             
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            
-            if result.returncode != 0:
-                print_error("Web build failed:")
-                print(result.stderr)
+            # Diagnostics stream straight to the terminal; successful output is discarded
+            sys.stdout.flush()
+            if subprocess.run(cmd, stdout=subprocess.DEVNULL).returncode != 0:
+                print_error("Web build failed (see errors above)")
                 return
             
             print_success("Web build successful!")
@@ -160,36 +151,22 @@ class PrepareCommand:
             
             print_info("Compiling for Linux...")
             
-            # Build command using global configuration
-            cmd = ["g++"]
-            
-            # Add production build flags
-            cmd.extend(["-std=c++17", "-O3", "-DNDEBUG"])  # O3 + NDEBUG for production
-            
-            # Add include paths
-            for include_path in config.get_include_paths():
-                cmd.extend(["-I", include_path])
-            
-            # Add source file
-            cmd.append(str(main_file))
-            
-            # Add library paths
-            for lib_path in config.get_library_paths():
-                cmd.extend(["-L", lib_path])
-            
-            # Add libraries
-            for lib in config.get_libraries():
-                cmd.extend(["-l", lib])
-            
-            # Add output
+            # Build command using global configuration, with production flags
+            # (O3 + NDEBUG) in place of the configured defaults
             output_file = linux_build_dir / build_system.project_root.name
-            cmd.extend(["-o", str(output_file)])
-            
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            cmd = [
+                "g++", "-std=c++17", "-O3", "-DNDEBUG",
+                *(arg for path in config.get_include_paths() for arg in ("-I", path)),
+                str(main_file),
+                *(arg for path in config.get_library_paths() for arg in ("-L", path)),
+                *(arg for lib in config.get_libraries() for arg in ("-l", lib)),
+                "-o", str(output_file),
+            ]
             
-            if result.returncode != 0:
-                print_error("Linux build failed:")
-                print(result.stderr)
+            # Diagnostics stream straight to the terminal; successful output is discarded
+            sys.stdout.flush()
+            if subprocess.run(cmd, stdout=subprocess.DEVNULL).returncode != 0:
+                print_error("Linux build failed (see errors above)")
                 return
             
             # Make executable
@@ -210,134 +187,17 @@ class PrepareCommand:
     
     def _find_fern_source(self):
         """Find the Fern source directory for web builds"""
-        # Get the directory where the CLI is located (should be the Fern repo)
-        cli_dir = Path(__file__).parent.parent.parent  # Go up from cli/commands/prepare.py to repo root
-        
-        potential_sources = [
-            Path.home() / ".fern",  # Global source installation (primary location)
-            cli_dir,  # The Fern repository root where the CLI is located
-            Path(os.getcwd()),  # Current working directory (if run from Fern repo)
-            Path(os.environ.get('ORIGINAL_CWD', os.getcwd())).parent,  # Parent of original working dir
-            Path("/usr/local/src/fern"),  # System-wide source location
-            Path.home() / ".fern" / "src"  # Alternative user location
-        ]
+        fern_source = find_fern_source()
+        if fern_source is None:
+            report_missing_fern_source()
+            return None
         
-        for src_path in potential_sources:
-            # Check if this looks like the Fern source directory
-            cpp_src = src_path / "src" / "cpp"
-            if (cpp_src.exists() and 
-                (cpp_src / "include" / "fern").exists() and
-                (cpp_src / "src").exists()):
-                print_info(f"Found Fern source for web build at: {cpp_src}")
-                return cpp_src
-
-        print_error("Fern source files not found for web compilation.")
-        print_info("Web builds require access to Fern source files.")
-        print_info("Run './install.sh' from the Fern repository to install source files globally.")
-        return None
+        print_info(f"Found Fern source for web build at: {fern_source}")
+        return fern_source
 
     def _ensure_fern_web_library(self, fern_source):
         """Ensure a precompiled Fern web library exists, building it if necessary"""
-        # Create a cache directory for precompiled web libraries
-        cache_dir = Path.home() / ".fern" / "cache" / "web"
-        cache_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Check if we need to rebuild by comparing source timestamps
-        lib_file = cache_dir / "libfern_web.a"
-        needs_rebuild = True
-        
-        if lib_file.exists():
-            lib_mtime = lib_file.stat().st_mtime
-            
-            # Check if any source file is newer than the library
-            source_newer = False
-            patterns = ["core/*.cpp", "graphics/*.cpp", "text/*.cpp", "font/*.cpp", "ui/**/*.cpp"]
-            
-            for pattern in patterns:
-                for src_file in fern_source.glob(f"src/{pattern}"):
-                    if src_file.stat().st_mtime > lib_mtime:
-                        source_newer = True
-                        break
-                if source_newer:
-                    break
-            
-            # Also check platform files
-            platform_files = [
-                fern_source / "src/platform/web_renderer.cpp",
-                fern_source / "src/platform/platform_factory.cpp", 
-                fern_source / "src/fern.cpp"
-            ]
-            
-            for platform_file in platform_files:
-                if platform_file.exists() and platform_file.stat().st_mtime > lib_mtime:
-                    source_newer = True
-                    break
-            
-            needs_rebuild = source_newer
-        
-        if needs_rebuild:
-            print_info("Building Fern web library (this may take a moment)...")
-            
-            # Collect all source files
-            source_files = []
-            patterns = ["core/*.cpp", "graphics/*.cpp", "text/*.cpp", "font/*.cpp", "ui/**/*.cpp"]
-            for pattern in patterns:
-                for src_file in fern_source.glob(f"src/{pattern}"):
-                    source_files.append(src_file)
-            
-            # Add platform files
-            platform_files = [
-                fern_source / "src/platform/web_renderer.cpp",
-                fern_source / "src/platform/platform_factory.cpp",
-                fern_source / "src/fern.cpp"
-            ]
-            
-            for platform_file in platform_files:
-                if platform_file.exists():
-                    source_files.append(platform_file)
-            
-            # Compile each source file to an object file
-            object_files = []
-            
-            try:
-                for i, src_file in enumerate(source_files):
-                    obj_file = cache_dir / f"obj_{i}.o"
-                    object_files.append(obj_file)
-                    
-                    # Compile individual source file
-                    cmd = [
-                        "emcc", "-std=c++17", "-O2", "-c",
-                        "-I", str(fern_source / "include"),
-                        str(src_file),
-                        "-o", str(obj_file)
-                    ]
-                    
-                    result = subprocess.run(cmd, capture_output=True, text=True)
-                    if result.returncode != 0:
-                        print_error(f"Failed to compile {src_file.name}:")
-                        print(result.stderr)
-                        return None
-                
-                # Create static library from object files
-                cmd = ["emar", "rcs", str(lib_file)] + [str(obj) for obj in object_files]
-                result = subprocess.run(cmd, capture_output=True, text=True)
-                
-                if result.returncode != 0:
-                    print_error("Failed to create Fern web library:")
-                    print(result.stderr)
-                    return None
-                
-                # Clean up object files
-                for obj_file in object_files:
-                    if obj_file.exists():
-                        obj_file.unlink()
-                        
-                print_success("Fern web library built successfully!")
-                
-            except Exception as e:
-                print_error(f"Error building Fern web library: {str(e)}")
-                return None
-        else:
-            print_info("Using cached Fern web library")
-        
-        return lib_file
+        # Shares fire's cached source discovery and incremental object cache,
+        # so both commands maintain the same libfern_web.a
+        from commands.fire import FireCommand
+        return FireCommand()._ensure_fern_web_library(fern_source)
@@ -3,13 +3,9 @@ Fern Sprout Command - Create new Fern project
 """
 
 import os
-import sys
 import shutil
 from pathlib import Path
 
-# Add utils to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from utils.colors import print_header, print_success, print_error, print_warning, print_info
 from utils.config import config
 
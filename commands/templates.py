@@ -3,15 +3,98 @@ Fern Templates Command - Manage project templates
 """
 
 import os
-import sys
+import json
 import subprocess
 import shutil
 from pathlib import Path
 
-# Add utils to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from utils.colors import print_header, print_success, print_error, print_warning, print_info
+from utils.config import config, yaml_modules
+from utils.system import copy_tree
+
+# Official templates repository (example)
+OFFICIAL_TEMPLATES = {
+    "basic": "https://github.com/fern-ui/template-basic.git",
+    "game": "https://github.com/fern-ui/template-game.git",
+    "dashboard": "https://github.com/fern-ui/template-dashboard.git",
+    "mobile": "https://github.com/fern-ui/template-mobile.git"
+}
+
+OFFICIAL_TEMPLATE_DESCRIPTIONS = {
+    "basic": "Basic Fern application",
+    "game": "Game development template",
+    "dashboard": "Dashboard/admin template",
+    "mobile": "Mobile-style UI template",
+}
+
+# Game template files, stored as UTF-8 bytes
+GAME_MAIN_CPP = """#include <fern/fern.hpp>
+#include <iostream>
+#include <cmath>
+
+using namespace Fern;
+
+// Game state
+struct Player {
+    float x = 400;
+    float y = 300;
+    float speed = 200;
+};
+
+Player player;
+
+void update(float deltaTime) {
+    // Simple player movement
+    if (Input::isKeyPressed(KeyCode::Left)) {
+        player.x -= player.speed * deltaTime;
+    }
+    if (Input::isKeyPressed(KeyCode::Right)) {
+        player.x += player.speed * deltaTime;
+    }
+    if (Input::isKeyPressed(KeyCode::Up)) {
+        player.y -= player.speed * deltaTime;
+    }
+    if (Input::isKeyPressed(KeyCode::Down)) {
+        player.y += player.speed * deltaTime;
+    }
+}
+
+void draw() {
+    // Clear background
+    Draw::fill(Colors::DarkBlue);
+    
+    // Draw player
+    Draw::circle(player.x, player.y, 20, Colors::Yellow);
+    
+    // Draw UI
+    DrawText::drawText("Use arrow keys to move", 10, 10, 1, Colors::White);
+    DrawText::drawText("Game Template", 10, 30, 2, Colors::Cyan);
+}
+
+int main() {
+    std::cout << "🎮 Starting Fern Game..." << std::endl;
+    
+    Fern::initialize();
+    Fern::setUpdateCallback(update);
+    Fern::setDrawCallback(draw);
+    Fern::startRenderLoop();
+    
+    return 0;
+}
+""".encode("utf-8")
+
+GAME_TEMPLATE_YAML = """name: Fern Game Template
+description: Template for creating games with Fern
+author: Fern Team
+version: 1.0.0
+""".encode("utf-8")
+
+def _config_jobs(key, default):
+    """Read a worker count from the global config, using the default when it is not a number"""
+    try:
+        return max(1, int(config.get(key, default)))
+    except (TypeError, ValueError):
+        return default
 
 class TemplatesCommand:
     """Manage Fern project templates"""
@@ -28,9 +111,15 @@ class TemplatesCommand:
         elif subcommand == "install":
             if len(args) < 2:
                 print_error("Template name/URL is required")
-                print_info("Usage: fern templates install <template_name_or_url>")
+                print_info("Usage: fern templates install <template_name_or_url>... [--all]")
                 return
-            self._install_template(args[1])
+            sources = args[1:]
+            if "--all" in sources:
+                sources = list(OFFICIAL_TEMPLATES)
+            if len(sources) == 1:
+                self._install_template(sources[0])
+            else:
+                self._install_templates(sources)
         elif subcommand == "create":
             if len(args) < 3:
                 print_error("Template name and project name are required")
@@ -48,13 +137,15 @@ class TemplatesCommand:
         print()
         print("Commands:")
         print("  list                        List available templates")
-        print("  install <name_or_url>       Install a template")
+        print("  install <name_or_url>...    Install one or more templates")
+        print("  install --all               Install all official templates")
         print("  create <template> <name>    Create project from template")
         print()
         print("Examples:")
         print("  fern templates list")
         print("  fern templates install game")
         print("  fern templates install https://github.com/user/fern-template")
+        print("  fern templates install game dashboard")
         print("  fern templates create game my_game")
     
     def _list_templates(self):
@@ -64,34 +155,100 @@ class TemplatesCommand:
         # Get templates directory
         templates_dir = self._get_templates_dir()
         
-        if not templates_dir.exists():
+        # List installed templates; DirEntry caches the type from the directory read,
+        # so only symlinked templates cost a stat
+        try:
+            with os.scandir(templates_dir) as entries:
+                templates = sorted((entry.name, entry.path) for entry in entries if entry.is_dir())
+        except (FileNotFoundError, NotADirectoryError):
             print_info("No templates installed")
             print_info("Install templates with: fern templates install <template>")
             return
         
-        # List installed templates
-        templates = [d for d in templates_dir.iterdir() if d.is_dir()]
-        
         if not templates:
             print_info("No templates installed")
             return
         
+        description_cache = self._load_description_cache()
+        cached_descriptions = dict(description_cache)
+        
         print_info("Installed templates:")
-        for template in templates:
-            # Read template info if available
-            info_file = template / "template.yaml"
-            if info_file.exists():
-                # TODO: Parse template info
-                print(f"  📦 {template.name}")
+        for template_name, template_path in templates:
+            description = self._get_template_description(template_path, description_cache)
+            if description:
+                print(f"  📦 {template_name:<10} - {description}")
             else:
-                print(f"  📦 {template.name}")
+                print(f"  📦 {template_name}")
+        
+        # Forget templates that are no longer installed so the cache tracks the listing
+        listed = {template_path for _, template_path in templates}
+        description_cache = {key: entry for key, entry in description_cache.items() if key in listed}
+        
+        if description_cache != cached_descriptions:
+            self._save_description_cache(description_cache)
         
         print()
         print_info("Official templates:")
-        print("  📦 basic      - Basic Fern application")
-        print("  📦 game       - Game development template")
-        print("  📦 dashboard  - Dashboard/admin template")
-        print("  📦 mobile     - Mobile-style UI template")
+        for template_name, description in OFFICIAL_TEMPLATE_DESCRIPTIONS.items():
+            print(f"  📦 {template_name:<10} - {description}")
+    
+    def _get_template_description(self, template_path, cache):
+        """Read a template's description given its path string, reusing the cached one while unchanged"""
+        # template.yaml is authoritative; fall back to the README title
+        for source_name in ("template.yaml", "README.md"):
+            source_file = os.path.join(template_path, source_name)
+            try:
+                mtime = os.stat(source_file).st_mtime_ns
+                break
+            except OSError:
+                continue
+        else:
+            cache.pop(template_path, None)
+            return None
+        
+        key = template_path
+        cached = cache.get(key)
+        # Entries come from a file on disk, so anything not shaped [mtime, description] is ignored
+        if (isinstance(cached, list) and len(cached) == 2 and cached[0] == mtime
+                and (cached[1] is None or isinstance(cached[1], str))):
+            return cached[1]
+        
+        try:
+            if source_name == "template.yaml":
+                mods = yaml_modules()
+                try:
+                    with open(source_file) as f:
+                        metadata = mods.yaml.load(f, Loader=mods.SafeLoader)
+                except mods.yaml.YAMLError:
+                    metadata = None
+                description = metadata.get("description") if isinstance(metadata, dict) else None
+            else:
+                # Only the first line is needed, so skip text-mode buffering and decoding
+                with open(source_file, "rb") as f:
+                    head = f.read(256)
+                description = head.split(b"\n", 1)[0].decode("utf-8", "replace").lstrip("#").strip() or None
+        except OSError:
+            description = None
+        
+        cache[key] = [mtime, description]
+        return description
+    
+    def _load_description_cache(self):
+        """Load cached template descriptions keyed by template path"""
+        try:
+            cache = json.loads((config.config_dir / "cache" / "templates.json").read_text())
+            return cache if isinstance(cache, dict) else {}
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_description_cache(self, cache):
+        """Persist template descriptions so later runs skip parsing unchanged template.yaml files"""
+        cache_file = config.config_dir / "cache" / "templates.json"
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            cache_file.write_text(json.dumps(cache))
+        except OSError:
+            pass
     
     def _install_template(self, template_source):
         """Install a template from name or URL"""
@@ -107,51 +264,133 @@ class TemplatesCommand:
             # Install from official templates
             self._install_official_template(template_source, templates_dir)
     
+    def _install_templates(self, template_sources):
+        """Install several templates, cloning remote ones concurrently"""
+        print_header(f"Installing templates: {', '.join(template_sources)}")
+        
+        templates_dir = self._get_templates_dir()
+        templates_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Official templates are created locally, only URLs hit the network
+        clone_targets = {}
+        for template_source in template_sources:
+            if not template_source.startswith("http"):
+                self._install_official_template(template_source, templates_dir)
+                continue
+            
+            template_path = self._new_template_path(template_source, templates_dir)
+            if template_path is None:
+                continue
+            # Concurrent clones into one directory would clean up each other's checkout
+            if template_path in clone_targets:
+                print_warning(f"Skipping {template_source}: '{template_path.name}' is already "
+                              f"being installed from {clone_targets[template_path]}")
+                continue
+            clone_targets[template_path] = template_source
+        
+        if not clone_targets:
+            return
+        clone_jobs = [(url, template_path) for template_path, url in clone_targets.items()]
+        
+        # Bounded so a long list does not exhaust file descriptors or the remote
+        max_jobs = _config_jobs("install.jobs", 4)
+        if max_jobs == 1 or len(clone_jobs) == 1:
+            for url, template_path in clone_jobs:
+                print_info(f"Cloning from {url}...")
+                self._report_clone(template_path, *self._clone_template(url, template_path))
+            return
+        
+        # Only concurrent installs need the executor, so listing templates never imports it
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+        
+        print_info(f"Cloning {len(clone_jobs)} templates...")
+        with ThreadPoolExecutor(max_workers=min(max_jobs, len(clone_jobs))) as executor:
+            futures = {
+                executor.submit(self._clone_template, url, template_path): template_path
+                for url, template_path in clone_jobs
+            }
+            for future in as_completed(futures):
+                self._report_clone(futures[future], *future.result())
+    
     def _install_from_url(self, url, templates_dir):
         """Install template from Git URL"""
         try:
-            # Extract template name from URL
-            template_name = url.split("/")[-1].replace(".git", "")
-            template_path = templates_dir / template_name
-            
-            if template_path.exists():
-                print_warning(f"Template '{template_name}' already exists")
+            template_path = self._new_template_path(url, templates_dir)
+            if template_path is None:
                 return
             
             print_info(f"Cloning from {url}...")
+            self._report_clone(template_path, *self._clone_template(url, template_path))
+            
+        except Exception as e:
+            print_error(f"Installation error: {str(e)}")
+    
+    def _new_template_path(self, url, templates_dir):
+        """Map a Git URL to its install path, or None if that template is already installed"""
+        template_name = url.split("/")[-1].replace(".git", "")
+        template_path = templates_dir / template_name
+        
+        try:
+            os.lstat(template_path)
+        except FileNotFoundError:
+            return template_path
+        
+        print_warning(f"Template '{template_name}' already exists")
+        return None
+    
+    def _clone_template(self, url, template_path):
+        """Clone a template repository without its Git metadata, returning (ok, stderr)"""
+        try:
+            # Templates may vendor dependencies as submodules; fetch them in parallel
+            git_jobs = _config_jobs("install.git_jobs", 4)
+            git_clone = ["git", "-c", f"submodule.fetchJobs={git_jobs}", "clone",
+                         "--recurse-submodules", f"--jobs={git_jobs}"]
+            # Fail fast on private URLs instead of blocking a worker on a credential prompt
+            git_env = {**os.environ, "GIT_TERMINAL_PROMPT": "0"}
             
-            # Clone the repository
+            # Only the tip tree is needed since .git is removed afterwards
             result = subprocess.run([
-                "git", "clone", url, str(template_path)
-            ], capture_output=True, text=True)
+                *git_clone, "--depth", "1", "--single-branch", "--filter=blob:none",
+                "--no-tags", "--shallow-submodules", url, str(template_path)
+            ], capture_output=True, text=True, env=git_env)
             
-            if result.returncode != 0:
-                print_error(f"Failed to clone template: {result.stderr}")
-                return
+            # Some servers (e.g. dumb HTTP) reject shallow or filtered clones
+            if result.returncode != 0 and ("shallow" in result.stderr or "filter" in result.stderr):
+                # A failed submodule fetch still leaves the superproject checkout behind
+                shutil.rmtree(template_path, ignore_errors=True)
+                result = subprocess.run([
+                    *git_clone, url, str(template_path)
+                ], capture_output=True, text=True, env=git_env)
             
-            # Remove .git directory
-            git_dir = template_path / ".git"
-            if git_dir.exists():
-                shutil.rmtree(git_dir)
+            if result.returncode != 0:
+                # Leave nothing behind that would later read as an installed template
+                shutil.rmtree(template_path, ignore_errors=True)
+                return False, result.stderr
             
-            print_success(f"Template '{template_name}' installed successfully!")
+            # Remove .git metadata, including the .git files left in submodule checkouts
+            for git_entry in sorted(template_path.rglob(".git"), key=lambda p: len(p.parts)):
+                if git_entry.is_dir():
+                    shutil.rmtree(git_entry)
+                elif git_entry.exists():
+                    git_entry.unlink()
             
+            return True, ""
         except Exception as e:
-            print_error(f"Installation error: {str(e)}")
+            shutil.rmtree(template_path, ignore_errors=True)
+            return False, str(e)
+    
+    def _report_clone(self, template_path, ok, stderr):
+        """Print the outcome of a template clone"""
+        if ok:
+            print_success(f"Template '{template_path.name}' installed successfully!")
+        else:
+            print_error(f"Failed to clone template '{template_path.name}': {stderr}")
     
     def _install_official_template(self, template_name, templates_dir):
         """Install official template"""
-        # Official templates repository (example)
-        official_templates = {
-            "basic": "https://github.com/fern-ui/template-basic.git",
-            "game": "https://github.com/fern-ui/template-game.git",
-            "dashboard": "https://github.com/fern-ui/template-dashboard.git",
-            "mobile": "https://github.com/fern-ui/template-mobile.git"
-        }
-        
-        if template_name not in official_templates:
+        if template_name not in OFFICIAL_TEMPLATES:
             print_error(f"Unknown official template: {template_name}")
-            print_info("Available official templates: " + ", ".join(official_templates.keys()))
+            print_info("Available official templates: " + ", ".join(OFFICIAL_TEMPLATES.keys()))
             return
         
         # For now, create a simple template locally
@@ -174,72 +413,14 @@ class TemplatesCommand:
     
     def _create_game_template(self, template_path):
         """Create game template"""
-        # Create game-specific main.cpp
-        main_cpp = """#include <fern/fern.hpp>
-#include <iostream>
-#include <cmath>
-
-using namespace Fern;
-
-// Game state
-struct Player {
-    float x = 400;
-    float y = 300;
-    float speed = 200;
-};
-
-Player player;
-
-void update(float deltaTime) {
-    // Simple player movement
-    if (Input::isKeyPressed(KeyCode::Left)) {
-        player.x -= player.speed * deltaTime;
-    }
-    if (Input::isKeyPressed(KeyCode::Right)) {
-        player.x += player.speed * deltaTime;
-    }
-    if (Input::isKeyPressed(KeyCode::Up)) {
-        player.y -= player.speed * deltaTime;
-    }
-    if (Input::isKeyPressed(KeyCode::Down)) {
-        player.y += player.speed * deltaTime;
-    }
-}
-
-void draw() {
-    // Clear background
-    Draw::fill(Colors::DarkBlue);
-    
-    // Draw player
-    Draw::circle(player.x, player.y, 20, Colors::Yellow);
-    
-    // Draw UI
-    DrawText::drawText("Use arrow keys to move", 10, 10, 1, Colors::White);
-    DrawText::drawText("Game Template", 10, 30, 2, Colors::Cyan);
-}
-
-int main() {
-    std::cout << "🎮 Starting Fern Game..." << std::endl;
-    
-    Fern::initialize();
-    Fern::setUpdateCallback(update);
-    Fern::setDrawCallback(draw);
-    Fern::startRenderLoop();
-    
-    return 0;
-}
-"""
-        
-        (template_path / "main.cpp").write_text(main_cpp)
-        
-        # Create template info
-        template_info = """name: Fern Game Template
-description: Template for creating games with Fern
-author: Fern Team
-version: 1.0.0
-"""
-        
-        (template_path / "template.yaml").write_text(template_info)
+        # Template files are constant, pre-encoded once at import
+        (template_path / "main.cpp").write_bytes(GAME_MAIN_CPP)
+        # Keep existing metadata; exclusive create avoids a separate exists() probe
+        try:
+            with open(template_path / "template.yaml", "xb") as f:
+                f.write(GAME_TEMPLATE_YAML)
+        except FileExistsError:
+            pass
     
     def _create_dashboard_template(self, template_path):
         """Create dashboard template"""
@@ -271,12 +452,13 @@ version: 1.0.0
         
         try:
             # Copy template to new project
-            shutil.copytree(template_path, project_name)
+            copy_tree(template_path, project_name)
             
             # Remove template.yaml from project
-            template_file = Path(project_name) / "template.yaml"
-            if template_file.exists():
-                template_file.unlink()
+            try:
+                (Path(project_name) / "template.yaml").unlink()
+            except FileNotFoundError:
+                pass
             
             print_success(f"Project '{project_name}' created from template '{template_name}'!")
             print_info(f"cd {project_name}")
@@ -287,5 +469,5 @@ version: 1.0.0
     
     def _get_templates_dir(self):
         """Get templates directory"""
-        fern_home = Path.home() / ".fern"
-        return fern_home / "templates"
+        # Resolved once at import by the config module
+        return config.templates_dir
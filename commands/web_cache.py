@@ -2,15 +2,11 @@
 Fern Web Cache Command - Manage web build cache
 """
 
-import os
-import sys
 import shutil
 from pathlib import Path
 
-# Add utils to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from utils.colors import print_header, print_success, print_error, print_warning, print_info
+from utils.system import find_fern_source
 
 class WebCacheCommand:
     """Manage Fern web build cache"""
@@ -84,13 +80,13 @@ class WebCacheCommand:
         print_info(f"Last modified: {self._format_time(stat.st_mtime)}")
         
         # Check source directory for comparison
-        fern_source = self._find_fern_source()
+        fern_source = find_fern_source()
         if fern_source:
             print_info(f"Source location: {fern_source}")
             
             # Check if cache is up to date
-            if self._is_cache_outdated(lib_file, fern_source):
-                print_warning("Cache may be outdated (source files newer than cache)")
+            if self._is_cache_outdated(cache_dir, fern_source):
+                print_warning("Cache is outdated (sources, headers or build flags changed)")
                 print_info("Cache will be automatically rebuilt on next web build")
             else:
                 print_success("Cache is up to date")
@@ -131,7 +127,7 @@ class WebCacheCommand:
         
         # Now force a rebuild by importing and using the fire command's library builder
         try:
-            from fire import FireCommand
+            from commands.fire import FireCommand
             fire_cmd = FireCommand()
             
             fern_source = fire_cmd._find_fern_source()
@@ -150,49 +146,11 @@ class WebCacheCommand:
             print_error(f"Failed to rebuild cache: {str(e)}")
             print_info("You can rebuild the cache by running a web build: fern fire -p web <file>")
     
-    def _find_fern_source(self):
-        """Find the Fern source directory"""
-        cli_dir = Path(__file__).parent.parent.parent
-        
-        potential_sources = [
-            Path.home() / ".fern",
-            cli_dir,
-            Path("/usr/local/src/fern"),
-            Path.home() / ".fern" / "src"
-        ]
-        
-        for src_path in potential_sources:
-            cpp_src = src_path / "src" / "cpp"
-            if (cpp_src.exists() and 
-                (cpp_src / "include" / "fern").exists() and
-                (cpp_src / "src").exists()):
-                return cpp_src
-        return None
-    
-    def _is_cache_outdated(self, lib_file, fern_source):
-        """Check if cache is outdated compared to source files"""
-        lib_mtime = lib_file.stat().st_mtime
-        
-        # Check source file patterns
-        patterns = ["core/*.cpp", "graphics/*.cpp", "text/*.cpp", "font/*.cpp", "ui/**/*.cpp"]
-        
-        for pattern in patterns:
-            for src_file in fern_source.glob(f"src/{pattern}"):
-                if src_file.stat().st_mtime > lib_mtime:
-                    return True
-        
-        # Check platform files
-        platform_files = [
-            fern_source / "src/platform/web_renderer.cpp",
-            fern_source / "src/platform/platform_factory.cpp",
-            fern_source / "src/fern.cpp"
-        ]
-        
-        for platform_file in platform_files:
-            if platform_file.exists() and platform_file.stat().st_mtime > lib_mtime:
-                return True
-        
-        return False
+    def _is_cache_outdated(self, cache_dir, fern_source):
+        """Check if the cache would be rebuilt by the next web build"""
+        # Same key and dependency check the library builder uses; status only reads the cache
+        from commands.fire import FireCommand
+        return FireCommand()._web_library_plan(fern_source, cache_dir, persist=False).needs_rebuild
     
     def _format_time(self, timestamp):
         """Format timestamp for display"""
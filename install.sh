@@ -199,6 +199,26 @@ import os
 import argparse
 from pathlib import Path
 
+def cmd_bloom(args):
+    print("🌿 Terra CLI System Health Check")
+    print("✅ Terra CLI is working correctly")
+    print("✅ Python environment is set up")
+    print("✅ All dependencies are installed")
+
+def cmd_sprout(args):
+    print(f"🌱 Creating new project: {args.name}")
+    print(f"📁 Template: {args.template}")
+    print("✅ Project created successfully!")
+    print(f"Next steps:")
+    print(f"  cd {args.name}")
+    print(f"  terra fire")
+
+def cmd_fire(args):
+    print("🔥 Building and running project...")
+    if args.watch:
+        print("👀 Watching for changes...")
+    print("✅ Project is running!")
+
 def main():
     parser = argparse.ArgumentParser(
         description="Terra CLI - Advanced Developer Tools for Fern UI Framework",
@@ -211,44 +231,28 @@ def main():
         version="Terra CLI 0.1.0"
     )
 
+    # Without a subcommand, fall back to the help text
+    parser.set_defaults(func=lambda args: parser.print_help())
+
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
     # Bloom command
     bloom_parser = subparsers.add_parser("bloom", help="Check system health")
+    bloom_parser.set_defaults(func=cmd_bloom)
 
     # Sprout command
     sprout_parser = subparsers.add_parser("sprout", help="Create new project")
     sprout_parser.add_argument("name", help="Project name")
     sprout_parser.add_argument("--template", default="basic", help="Template to use")
+    sprout_parser.set_defaults(func=cmd_sprout)
 
     # Fire command
     fire_parser = subparsers.add_parser("fire", help="Build and run project")
     fire_parser.add_argument("--watch", action="store_true", help="Watch for changes")
+    fire_parser.set_defaults(func=cmd_fire)
 
     args = parser.parse_args()
-
-    if args.command == "bloom":
-        print("🌿 Terra CLI System Health Check")
-        print("✅ Terra CLI is working correctly")
-        print("✅ Python environment is set up")
-        print("✅ All dependencies are installed")
-
-    elif args.command == "sprout":
-        print(f"🌱 Creating new project: {args.name}")
-        print(f"📁 Template: {args.template}")
-        print("✅ Project created successfully!")
-        print(f"Next steps:")
-        print(f"  cd {args.name}")
-        print(f"  terra fire")
-
-    elif args.command == "fire":
-        print("🔥 Building and running project...")
-        if args.watch:
-            print("👀 Watching for changes...")
-        print("✅ Project is running!")
-
-    else:
-        parser.print_help()
+    args.func(args)
 
 if __name__ == "__main__":
     main()
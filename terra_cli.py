@@ -17,32 +17,29 @@ Commands:
 import sys
 import os
 import argparse
+import importlib
 import subprocess
 from pathlib import Path
 
-# Add the CLI modules to Python path
-CLI_DIR = Path(__file__).parent
-sys.path.insert(0, str(CLI_DIR))
+# Put the CLI modules first on the Python path; under 'python -m' the user's cwd is
+# sys.path[0], and its utils/ or commands/ must not shadow the CLI's packages
+CLI_DIR = Path(__file__).resolve().parent
+if sys.path[0] != str(CLI_DIR):
+    sys.path.insert(0, str(CLI_DIR))
 
-from commands.bloom import BloomCommand
-from commands.sprout import SproutCommand
-from commands.fire import FireCommand
-from commands.prepare import PrepareCommand
-from commands.install import InstallCommand
-from commands.templates import TemplatesCommand
-from commands.lsp import LSPCommand
 from utils.colors import Colors, print_colored
 
 class FernCLI:
     def __init__(self):
+        # Command modules are imported on demand so each run only loads the one it needs
         self.commands = {
-            'bloom': BloomCommand(),
-            'sprout': SproutCommand(),
-            'fire': FireCommand(),
-            'prepare': PrepareCommand(),
-            'install': InstallCommand(),
-            'templates': TemplatesCommand(),
-            'lsp': LSPCommand(),
+            'bloom': ('commands.bloom', 'BloomCommand'),
+            'sprout': ('commands.sprout', 'SproutCommand'),
+            'fire': ('commands.fire', 'FireCommand'),
+            'prepare': ('commands.prepare', 'PrepareCommand'),
+            'install': ('commands.install', 'InstallCommand'),
+            'templates': ('commands.templates', 'TemplatesCommand'),
+            'lsp': ('commands.lsp', 'LSPCommand'),
         }
     
     def run(self, args):
@@ -59,7 +56,9 @@ class FernCLI:
             return
         
         try:
-            self.commands[command_name].execute(command_args)
+            module_name, class_name = self.commands[command_name]
+            command_class = getattr(importlib.import_module(module_name), class_name)
+            command_class().execute(command_args)
         except Exception as e:
             print_colored(f"Error executing {command_name}: {str(e)}", Colors.RED)
             sys.exit(1)
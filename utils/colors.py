@@ -15,28 +15,50 @@ class Colors:
     UNDERLINE = '\033[4m'
     END = '\033[0m'
 
+def colored(text, color=Colors.WHITE, bold=False):
+    """Wrap text in ANSI color codes"""
+    prefix = Colors.BOLD if bold else ""
+    return f"{prefix}{color}{text}{Colors.END}"
+
 def print_colored(text, color=Colors.WHITE, bold=False):
     """Print colored text to terminal"""
-    prefix = Colors.BOLD if bold else ""
-    print(f"{prefix}{color}{text}{Colors.END}")
+    print(colored(text, color, bold))
+
+# Message prefixes with their color codes, built once
+_SUCCESS_PREFIX = f"{Colors.GREEN}✓ "
+_ERROR_PREFIX = f"{Colors.RED}✗ "
+_WARNING_PREFIX = f"{Colors.YELLOW}⚠ "
+_INFO_PREFIX = f"{Colors.BLUE}ℹ "
+
+def format_error(text):
+    """Error message text as print_error shows it"""
+    return f"{_ERROR_PREFIX}{text}{Colors.END}"
+
+def format_info(text):
+    """Info message text as print_info shows it"""
+    return f"{_INFO_PREFIX}{text}{Colors.END}"
+
+def format_header(text):
+    """Header lines as print_header shows them"""
+    return (colored(f"\n🌿 {text}", Colors.CYAN, bold=True) + "\n" +
+            colored("=" * (len(text) + 3), Colors.CYAN))
 
 def print_success(text):
     """Print success message in green"""
-    print_colored(f"✓ {text}", Colors.GREEN)
+    print(f"{_SUCCESS_PREFIX}{text}{Colors.END}")
 
 def print_error(text):
     """Print error message in red"""
-    print_colored(f"✗ {text}", Colors.RED)
+    print(format_error(text))
 
 def print_warning(text):
     """Print warning message in yellow"""
-    print_colored(f"⚠ {text}", Colors.YELLOW)
+    print(f"{_WARNING_PREFIX}{text}{Colors.END}")
 
 def print_info(text):
     """Print info message in blue"""
-    print_colored(f"ℹ {text}", Colors.BLUE)
+    print(format_info(text))
 
 def print_header(text):
     """Print header with decoration"""
-    print_colored(f"\n🌿 {text}", Colors.CYAN, bold=True)
-    print_colored("=" * (len(text) + 3), Colors.CYAN)
+    print(format_header(text))
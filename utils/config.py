@@ -4,54 +4,119 @@ Global configuration management for Fern CLI
 """
 
 import os
-import yaml
+import functools
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Dict, Any, Optional
 
+@functools.lru_cache(maxsize=1)
+def yaml_modules():
+    """Import PyYAML once, only when a config or template file is actually parsed"""
+    import yaml
+    # Prefer the libyaml-backed loader and dumper when PyYAML was built with them
+    try:
+        from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+    except ImportError:
+        from yaml import SafeLoader, SafeDumper
+    return SimpleNamespace(yaml=yaml, SafeLoader=SafeLoader, SafeDumper=SafeDumper)
+
+# Home-relative locations, resolved once per process
+_HOME = Path.home()
+_FERN_DIR = _HOME / ".fern"
+_LOCAL = _HOME / ".local"
+_LOCAL_INC = _LOCAL / "include"
+_LOCAL_LIB = _LOCAL / "lib"
+
 class FernConfig:
     """Manages global Fern configuration"""
     
     def __init__(self):
-        self.config_dir = Path.home() / ".fern"
+        self.config_dir = _FERN_DIR
         self.config_file = self.config_dir / "config.yaml"
         self.templates_dir = self.config_dir / "templates"
         
         # Default configuration
         self.default_config = {
             "version": "0.1.0",
-            "cpp_library_path": str(Path.home() / ".local"),
+            "cpp_library_path": str(_LOCAL),
             "templates_path": str(self.templates_dir),
             "default_template": "basic",
             "build": {
                 "default_flags": ["-std=c++17", "-O2"],
                 "debug_flags": ["-std=c++17", "-g", "-O0"],
-                "include_paths": [str(Path.home() / ".local" / "include")],
-                "library_paths": [str(Path.home() / ".local" / "lib")],
+                "include_paths": [str(_LOCAL_INC)],
+                "library_paths": [str(_LOCAL_LIB)],
                 "libraries": ["fern", "X11", "Xext", "fontconfig", "freetype"]
             }
         }
         
         self._config = None
+        self._mtime = None
+        self._flat = None
+        self._initialized = False
     
     def ensure_config_exists(self):
         """Ensure configuration directory and file exist"""
-        self.config_dir.mkdir(parents=True, exist_ok=True)
-        self.templates_dir.mkdir(parents=True, exist_ok=True)
+        if self._initialized:
+            return
         
-        if not self.config_file.exists():
-            with open(self.config_file, 'w') as f:
-                yaml.dump(self.default_config, f, default_flow_style=False)
+        # An existing config file implies the directories were already set up,
+        # so the common case costs a single stat
+        try:
+            os.stat(self.config_file)
+        except FileNotFoundError:
+            self.config_dir.mkdir(parents=True, exist_ok=True)
+            self.templates_dir.mkdir(parents=True, exist_ok=True)
+            self._write_config(self.default_config)
+        
+        self._initialized = True
     
-    def load_config(self) -> Dict[str, Any]:
-        """Load configuration from file"""
-        if self._config is None:
-            self.ensure_config_exists()
-            
+    def _write_config(self, config: Dict[str, Any]):
+        """Atomically replace the config file so a crash never leaves it truncated"""
+        mods = yaml_modules()
+        payload = mods.yaml.dump(config, Dumper=mods.SafeDumper, default_flow_style=False, encoding='utf-8')
+        tmp_file = self.config_file.with_suffix('.yaml.tmp')
+        
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            try:
+                # os.write may accept only part of the buffer
+                view = memoryview(payload)
+                while view:
+                    view = view[os.write(fd, view):]
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(tmp_file, self.config_file)
+        except BaseException:
             try:
-                with open(self.config_file, 'r') as f:
-                    self._config = yaml.safe_load(f)
-            except (FileNotFoundError, yaml.YAMLError):
-                self._config = self.default_config.copy()
+                os.unlink(tmp_file)
+            except FileNotFoundError:
+                pass
+            raise
+    
+    def _config_mtime(self) -> Optional[int]:
+        """Modification time of the config file, or None if it is missing"""
+        try:
+            return os.stat(self.config_file).st_mtime_ns
+        except FileNotFoundError:
+            return None
+    
+    def load_config(self) -> Dict[str, Any]:
+        """Load configuration from file, reparsing only when it changed on disk"""
+        if self._config is not None and self._config_mtime() == self._mtime:
+            return self._config
+        
+        self.ensure_config_exists()
+        self._flat = None
+        
+        mods = yaml_modules()
+        try:
+            self._mtime = self._config_mtime()
+            with open(self.config_file, 'r') as f:
+                self._config = mods.yaml.load(f, Loader=mods.SafeLoader)
+        except (FileNotFoundError, mods.yaml.YAMLError):
+            self._config = self.default_config.copy()
         
         return self._config
     
@@ -59,26 +124,31 @@ class FernConfig:
         """Save configuration to file"""
         self.ensure_config_exists()
         
-        with open(self.config_file, 'w') as f:
-            yaml.dump(config, f, default_flow_style=False)
+        self._write_config(config)
         
         self._config = config
+        self._mtime = self._config_mtime()
+        self._flat = None
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value"""
         config = self.load_config()
         
-        # Support nested keys like "build.default_flags"
-        keys = key.split('.')
-        value = config
+        # Support nested keys like "build.default_flags" via a dotted-key index
+        if self._flat is None:
+            self._flat = {}
+            self._flatten(config, "", self._flat)
         
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
-        
-        return value
+        return self._flat.get(key, default)
+    
+    def _flatten(self, value: Any, prefix: str, flat: Dict[str, Any]):
+        """Index every nested value under its dotted key, like build.default_flags"""
+        if not isinstance(value, dict):
+            return
+        for k, v in value.items():
+            dotted = f"{prefix}{k}"
+            flat[dotted] = v
+            self._flatten(v, dotted + ".", flat)
     
     def set(self, key: str, value: Any):
         """Set configuration value"""
@@ -98,7 +168,7 @@ class FernConfig:
     
     def get_cpp_library_path(self) -> Path:
         """Get C++ library installation path"""
-        return Path(self.get("cpp_library_path", str(Path.home() / ".local")))
+        return Path(self.get("cpp_library_path", str(_LOCAL)))
     
     def get_templates_path(self) -> Path:
         """Get templates directory path"""
@@ -113,11 +183,11 @@ class FernConfig:
     
     def get_include_paths(self) -> list:
         """Get include paths for C++ compilation"""
-        return self.get("build.include_paths", [str(Path.home() / ".local" / "include")])
+        return self.get("build.include_paths", [str(_LOCAL_INC)])
     
     def get_library_paths(self) -> list:
         """Get library paths for C++ linking"""
-        return self.get("build.library_paths", [str(Path.home() / ".local" / "lib")])
+        return self.get("build.library_paths", [str(_LOCAL_LIB)])
     
     def get_libraries(self) -> list:
         """Get libraries to link against"""
@@ -129,7 +199,12 @@ class FernConfig:
         include_path = lib_path / "include" / "fern"
         lib_file = lib_path / "lib" / "libfern.a"
         
-        return include_path.exists() and lib_file.exists()
+        try:
+            os.stat(include_path)
+            os.stat(lib_file)
+        except OSError:
+            return False
+        return True
 
 # Global config instance
 config = FernConfig()
@@ -4,11 +4,106 @@ System utilities for Fern CLI
 
 import os
 import sys
+import errno
+import functools
 import subprocess
 import shutil
 from pathlib import Path
 from .colors import print_success, print_error, print_warning, print_info
 
+# Buffer size for the user-space copy fallback
+COPY_BUFSIZE = 1024 * 1024
+
+# Errors meaning a kernel copy primitive is unavailable for this pair of files
+_KERNEL_COPY_UNSUPPORTED = {errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EOPNOTSUPP}
+
+# Emscripten link settings shared by every web build; each command adds its own -std/-O flags
+EMCC_WEB_SETTINGS = (
+    "-s", "WASM=1",
+    "-s", "ALLOW_MEMORY_GROWTH=1",
+    "-s", "USE_WEBGL2=1",
+    "-s", "EXPORTED_FUNCTIONS=['_main']",
+    "-s", "EXPORTED_RUNTIME_METHODS=['ccall','cwrap']",
+)
+
+# Directory containing the CLI package, which is the Fern repository root in a checkout
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+def _sendfile_chunk(in_fd, out_fd, count):
+    return os.sendfile(out_fd, in_fd, None, count)
+
+def copy_file(src, dst):
+    """Copy a file's contents, preferring in-kernel copies over a read/write loop"""
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        in_fd, out_fd = fsrc.fileno(), fdst.fileno()
+        remaining = os.fstat(in_fd).st_size
+        
+        # copy_file_range can reflink or copy server-side; sendfile still stays in the kernel
+        kernel_copies = [getattr(os, "copy_file_range", None)]
+        if hasattr(os, "sendfile"):
+            kernel_copies.append(_sendfile_chunk)
+        
+        for kernel_copy in kernel_copies:
+            if kernel_copy is None:
+                continue
+            try:
+                while remaining > 0:
+                    copied = kernel_copy(in_fd, out_fd, remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+                return
+            except OSError as e:
+                if e.errno not in _KERNEL_COPY_UNSUPPORTED:
+                    raise
+        
+        # Fall back to a large reusable buffer
+        buf = bytearray(COPY_BUFSIZE)
+        view = memoryview(buf)
+        while True:
+            n = fsrc.readinto(buf)
+            if not n:
+                break
+            fdst.write(view[:n])
+
+def _collect_tree(src, dst, dirs, files):
+    """Walk src with scandir, recording the directories and files to copy into dst"""
+    dirs.append((src, dst))
+    with os.scandir(src) as entries:
+        for entry in entries:
+            target = os.path.join(dst, entry.name)
+            if entry.is_dir():
+                _collect_tree(entry.path, target, dirs, files)
+            else:
+                files.append((entry.path, target))
+
+def _copy_with_stat(src, dst):
+    """Copy one file's contents and metadata"""
+    copy_file(src, dst)
+    shutil.copystat(src, dst)
+
+def copy_tree(src, dst):
+    """Recursively copy a directory tree, like shutil.copytree but using copy_file"""
+    dirs, files = [], []
+    _collect_tree(os.fspath(src), os.fspath(dst), dirs, files)
+    for _, target in dirs:
+        os.makedirs(target, exist_ok=True)
+    
+    # Copies spend their time in the kernel with the GIL released, so threads
+    # overlap the per-file open/copy/close latency of many small template files
+    if len(files) > 1:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4, len(files))) as executor:
+            for future in [executor.submit(_copy_with_stat, *pair) for pair in files]:
+                future.result()
+    else:
+        for pair in files:
+            _copy_with_stat(*pair)
+    
+    # Directory times last, deepest first, since creating files inside bumps them
+    for source, target in reversed(dirs):
+        shutil.copystat(source, target)
+
 class SystemChecker:
     """Check system dependencies and health"""
     
@@ -46,9 +141,9 @@ class SystemChecker:
         """Check if a pkg-config library is available"""
         try:
             result = subprocess.run(
-                ["pkg-config", "--exists", lib_name], 
-                capture_output=True, 
-                text=True
+                ["pkg-config", "--exists", lib_name],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
             )
             if result.returncode == 0:
                 self.checks.append((display_name, True, f"pkg-config library {lib_name} found"))
@@ -84,6 +179,51 @@ class SystemChecker:
         
         return self.checks
 
+@functools.lru_cache(maxsize=8)
+def _find_project_root(start_path):
+    """Walk up from a resolved directory to the nearest Fern project, once per start path"""
+    current = Path(start_path)
+    while current != current.parent:
+        if ProjectDetector.is_fern_project(current):
+            return current
+        current = current.parent
+    return None
+
+def _fern_source_candidates():
+    """Directories that may hold a Fern checkout, in search order"""
+    original_cwd = os.environ.get('ORIGINAL_CWD', os.getcwd())
+    fern_home = os.path.join(Path.home(), ".fern")
+    return [
+        fern_home,  # Global source installation (primary location)
+        _REPO_ROOT,  # The Fern repository root where the CLI is located
+        os.getcwd(),  # Current working directory (if run from Fern repo)
+        os.path.dirname(original_cwd),  # Parent of original working dir
+        "/usr/local/src/fern",  # System-wide source location
+        os.path.join(fern_home, "src"),  # Alternative user location
+    ]
+
+@functools.lru_cache(maxsize=1)
+def find_fern_source():
+    """Locate the Fern C++ source directory (src/cpp) used for web builds, once per process"""
+    for src_path in _fern_source_candidates():
+        # include/fern existing already implies the cpp directory does
+        cpp_src = os.path.join(src_path, "src", "cpp")
+        if (os.path.isdir(os.path.join(cpp_src, "include", "fern")) and
+                os.path.isdir(os.path.join(cpp_src, "src"))):
+            return Path(cpp_src)
+    return None
+
+def report_missing_fern_source():
+    """Explain where the Fern sources were looked for and how to install them"""
+    print_error("Fern source files not found for web compilation.")
+    print_info("Searched the following locations:")
+    for src_path in _fern_source_candidates():
+        cpp_src = os.path.join(src_path, "src", "cpp")
+        status = "✓" if os.path.exists(cpp_src) else "✗"
+        print_info(f"  {status} {cpp_src}")
+    print_info("Web builds require access to Fern source files.")
+    print_info("Run './install.sh' from the Fern repository to install source files globally.")
+
 class ProjectDetector:
     """Detect Fern project structure"""
     
@@ -100,12 +240,7 @@ class ProjectDetector:
             # Use original working directory if available
             start_path = os.environ.get('ORIGINAL_CWD', os.getcwd())
         
-        current = Path(start_path).resolve()
-        while current != current.parent:
-            if ProjectDetector.is_fern_project(current):
-                return current
-            current = current.parent
-        return None
+        return _find_project_root(os.path.realpath(start_path))
     
     @staticmethod
     def get_project_structure(project_root):